@@ -10,6 +10,7 @@ from hashlib import sha256
 from typing import (
     ClassVar,
     Dict,
+    Final,
     Generic,
     Iterator,
     List,
@@ -77,7 +78,8 @@ class SourceLocation:
         return str(self)
 
 
-NO_SOURCE_LOCATION = SourceLocation(-1, -1)
+# shared default location for nodes created without a source position
+NO_SOURCE_LOCATION: Final[SourceLocation] = SourceLocation(-1, -1)
 
 
 @public
@@ -279,7 +281,6 @@ class ASTNodes(Generic[ASTType], AST):
 
     name: str
     nodes: list[ASTType]
-    position: int = 0
 
     def __init__(
         self,
@@ -291,22 +292,10 @@ class ASTNodes(Generic[ASTType], AST):
         super().__init__(loc=loc, parent=parent)
         self.name = name
         self.nodes: list[ASTType] = []
-        self.position: int = 0
 
     def __iter__(self) -> Iterator[ASTType]:
         """Overload `iter` magic function."""
-        self.position = 0  # Reset position for fresh iteration
-        return self
-
-    def __next__(self) -> ASTType:
-        """Overload `next` magic function."""
-        if self.position >= len(self.nodes):
-            self.position = 0
-            raise StopIteration()
-
-        i = self.position
-        self.position += 1
-        return self.nodes[i]
+        return iter(self.nodes)
 
     def append(self, value: ASTType) -> None:
         """Append a new node to the stack."""
@@ -322,13 +311,10 @@ class ASTNodes(Generic[ASTType], AST):
 
     def get_struct(self, simplified: bool = False) -> ReprStruct:
         """Return a string that represents the object."""
-        args_nodes = []
-
-        for node in self.nodes:
-            args_nodes.append(node.get_struct(simplified))
-
         key = str(self)
-        value = cast(ReprStruct, args_nodes)
+        value: ReprStruct = [
+            node.get_struct(simplified) for node in self.nodes
+        ]
         return self._prepare_struct(key, value, simplified)
 
 
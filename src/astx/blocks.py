@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Optional
 
 from public import public
 
 from astx.base import (
+    NO_SOURCE_LOCATION,
     ASTNodes,
     ASTType,
     ReprStruct,
+    SourceLocation,
 )
 from astx.tools.typing import typechecked
 
@@ -19,14 +21,22 @@ from astx.tools.typing import typechecked
 class Block(ASTNodes[ASTType]):
     """The AST tree."""
 
+    def __init__(
+        self,
+        name: str = "entry",
+        loc: SourceLocation = NO_SOURCE_LOCATION,
+        parent: Optional[ASTNodes] = None,
+        nodes: Optional[list[ASTType]] = None,
+    ) -> None:
+        """Initialize the Block instance."""
+        super().__init__(name=name, loc=loc, parent=parent)
+        if nodes is not None:
+            self.nodes.extend(nodes)
+
     def get_struct(self, simplified: bool = False) -> ReprStruct:
         """Return the AST structure of the object."""
-        block_nodes = []
-
-        for node in self.nodes:
-            block_nodes.append(node.get_struct(simplified))
-
         key = f"BLOCK[{self.name}]"
-        value = cast(ReprStruct, block_nodes)
-
+        value: ReprStruct = [
+            node.get_struct(simplified) for node in self.nodes
+        ]
         return self._prepare_struct(key, value, simplified)
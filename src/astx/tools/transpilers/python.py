@@ -1,222 +1,361 @@
 """ASTx Python transpiler."""
 
-from typing import Union
-
-from plum import dispatch
+import os
+
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import astx
 
 from astx.tools.typing import typechecked
 
+_T = TypeVar("_T")
+
+
+def _debug_typechecked(cls: Type[_T]) -> Type[_T]:
+    """Apply runtime type checks only if ASTX_RUNTIME_TYPECHECK is set."""
+    if os.environ.get("ASTX_RUNTIME_TYPECHECK"):
+        return typechecked(cls)
+    return cls
+
 
-@typechecked
+@_debug_typechecked
 class ASTxPythonTranspiler:
     """
     Transpiler that converts ASTx nodes to Python code.
 
     Notes
     -----
-    Please keep the visit method in alphabet order according to the node type.
-    The visit method for astx.AST should be the first one.
+    `visit` dispatches on the exact node type through a precomputed
+    type-to-handler table, falling back to the node MRO for subclasses.
+    Please keep the `_visit_*` handlers, and their entries in the table,
+    in alphabetical order according to the node type.
     """
 
+    __slots__ = (
+        "_indents",
+        "_leaf_visitors",
+        "_lines_visitors",
+        "_visitors",
+        "indent_level",
+        "indent_str",
+    )
+
+    # data types that are always translated to the same Python type name
+    _TYPE_STRINGS: ClassVar[Dict[type, str]] = {
+        astx.Complex32: "Complex",
+        astx.Complex64: "Complex",
+        astx.Date: "date",
+        astx.DateTime: "datetime",
+        astx.Float16: "float",
+        astx.Float32: "float",
+        astx.Float64: "float",
+        astx.Int32: "int",
+        astx.Time: "time",
+        astx.Timestamp: "timestamp",
+        astx.UTF8Char: "str",
+        astx.UTF8String: "str",
+    }
+
+    # nodes whose handlers never recurse into `visit`; they are the most
+    # frequent nodes, so `visit` looks them up first
+    _LEAF_TYPES: ClassVar[FrozenSet[type]] = frozenset(
+        (
+            astx.AliasExpr,
+            astx.LiteralBoolean,
+            astx.LiteralComplex,
+            astx.LiteralComplex32,
+            astx.LiteralComplex64,
+            astx.LiteralDate,
+            astx.LiteralDateTime,
+            astx.LiteralFloat16,
+            astx.LiteralFloat32,
+            astx.LiteralFloat64,
+            astx.LiteralInt32,
+            astx.LiteralTime,
+            astx.LiteralTimestamp,
+            astx.LiteralUTF8Char,
+            astx.LiteralUTF8String,
+            astx.SubscriptExpr,
+            astx.Variable,
+        )
+    )
+
     def __init__(self) -> None:
         self.indent_level = 0
         self.indent_str = "    "  # 4 spaces
+        # indentation strings by level, grown on demand
+        self._indents: List[str] = [""]
+        self._visitors: Dict[type, Callable[[Any], str]] = {
+            astx.AliasExpr: self._visit_alias_expr,
+            astx.Argument: self._visit_argument,
+            astx.Arguments: self._visit_arguments,
+            astx.BinaryOp: self._visit_binary_op,
+            astx.Block: self._visit_block,
+            astx.ClassDefStmt: self._visit_class_def_stmt,
+            astx.EnumDeclStmt: self._visit_enum_decl_stmt,
+            astx.ForRangeLoopExpr: self._visit_for_range_loop_expr,
+            astx.Function: self._visit_function,
+            astx.FunctionReturn: self._visit_function_return,
+            astx.IfExpr: self._visit_if_expr,
+            astx.IfStmt: self._visit_if_stmt,
+            astx.ImportExpr: self._visit_import_expr,
+            astx.ImportFromExpr: self._visit_import_from_expr,
+            astx.ImportFromStmt: self._visit_import_from_stmt,
+            astx.ImportStmt: self._visit_import_stmt,
+            astx.LambdaExpr: self._visit_lambda_expr,
+            astx.LiteralBoolean: self._visit_literal_boolean,
+            astx.LiteralComplex: self._visit_literal_complex,
+            astx.LiteralComplex32: self._visit_literal_complex32,
+            astx.LiteralComplex64: self._visit_literal_complex64,
+            astx.LiteralDate: self._visit_literal_date,
+            astx.LiteralDateTime: self._visit_literal_date_time,
+            astx.LiteralFloat16: self._visit_literal_float16,
+            astx.LiteralFloat32: self._visit_literal_float32,
+            astx.LiteralFloat64: self._visit_literal_float64,
+            astx.LiteralInt32: self._visit_literal_int32,
+            astx.LiteralTime: self._visit_literal_time,
+            astx.LiteralTimestamp: self._visit_literal_timestamp,
+            astx.LiteralUTF8Char: self._visit_literal_utf8_char,
+            astx.LiteralUTF8String: self._visit_literal_utf8_string,
+            astx.StructDeclStmt: self._visit_struct_stmt,
+            astx.StructDefStmt: self._visit_struct_stmt,
+            astx.SubscriptExpr: self._visit_subscript_expr,
+            astx.TypeCastExpr: self._visit_type_cast_expr,
+            astx.UnaryOp: self._visit_unary_op,
+            astx.Variable: self._visit_variable,
+            astx.VariableAssignment: self._visit_variable_assignment,
+            astx.VariableDeclaration: self._visit_variable_declaration,
+            astx.WhileExpr: self._visit_while_expr,
+            astx.WhileStmt: self._visit_while_stmt,
+        }
+        for type_ in self._TYPE_STRINGS:
+            self._visitors[type_] = self._visit_data_type
+        self._leaf_visitors: Dict[type, Callable[[Any], str]] = {
+            type_: self._visitors[type_] for type_ in self._LEAF_TYPES
+        }
+        # statements that span multiple lines
+        self._lines_visitors: Dict[type, Callable[[Any], List[str]]] = {
+            astx.Function: self._function_lines,
+            astx.IfStmt: self._if_stmt_lines,
+            astx.WhileStmt: self._while_stmt_lines,
+        }
 
     def _generate_block(self, block: astx.Block) -> str:
         """Generate code for a block of statements with proper indentation."""
+        return "\n".join(self._generate_block_lines(block))
+
+    def _generate_block_lines(self, block: astx.Block) -> List[str]:
+        """Generate the indented lines for a block of statements."""
         self.indent_level += 1
-        indent = self.indent_str * self.indent_level
-        lines = [indent + self.visit(node) for node in block.nodes]
-        result = (
-            "\n".join(lines)
-            if lines
-            else self.indent_str * self.indent_level + "pass"
-        )
+        # rebuild the cached indents if `indent_str` was changed
+        if len(self._indents) > 1 and self._indents[1] != self.indent_str:
+            self._indents = [""]
+        while len(self._indents) <= self.indent_level:
+            self._indents.append(self._indents[-1] + self.indent_str)
+        indent = self._indents[self.indent_level]
+        lines: List[str] = []
+        # bound once as this loop runs for every node of every block
+        get_lines_visitor = self._lines_visitors.get
+        visit = self.visit
+        append = lines.append
+        for node in block.nodes:
+            lines_visitor = get_lines_visitor(type(node))
+            if lines_visitor is None:
+                append(indent + visit(node))
+                continue
+            # nested statements keep their lines, the outer block only
+            # indents the header as the inner lines are already indented
+            node_lines = lines_visitor(node)
+            append(indent + node_lines[0])
+            lines.extend(node_lines[1:])
+        if not lines:
+            lines.append(indent + "pass")
         self.indent_level -= 1
-        return result
+        return lines
+
+    def _function_lines(self, node: astx.Function) -> List[str]:
+        """Generate the lines for a Function node."""
+        args = self.visit(node.prototype.args)
+        returns = (
+            f" -> {self.visit(node.prototype.return_type)}"
+            if node.prototype.return_type
+            else ""
+        )
+        header = f"def {node.name}({args}){returns}:"
+        return [header, *self._generate_block_lines(node.body)]
+
+    def _if_stmt_lines(self, node: astx.IfStmt) -> List[str]:
+        """Generate the lines for an IfStmt node."""
+        lines = [
+            f"if {self.visit(node.condition)}:",
+            *self._generate_block_lines(node.then),
+        ]
+        if node.else_:
+            lines.append("else:")
+            lines.extend(self._generate_block_lines(node.else_))
+        return lines
+
+    def _while_stmt_lines(self, node: astx.WhileStmt) -> List[str]:
+        """Generate the lines for a WhileStmt node."""
+        return [
+            f"while {self.visit(node.condition)}:",
+            *self._generate_block_lines(node.body),
+        ]
+
+    def _resolve_visitor(self, node_type: type) -> Callable[[Any], str]:
+        """Find the handler for a node type through its MRO and cache it."""
+        for base in node_type.__mro__[1:]:
+            visitor = self._visitors.get(base)
+            if visitor is not None:
+                self._visitors[node_type] = visitor
+                return visitor
+        raise Exception(f"Not implemented yet ({node_type}).")
 
-    @dispatch.abstract
-    def visit(self, expr: astx.AST) -> str:
+    def visit(self, node: astx.AST) -> str:
         """Translate an ASTx expression."""
-        raise Exception(f"Not implemented yet ({expr}).")
+        node_type = type(node)
+        type_str = self._TYPE_STRINGS.get(node_type)
+        if type_str is not None:
+            return type_str
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.AliasExpr) -> str:
+        leaf_visitor = self._leaf_visitors.get(node_type)
+        if leaf_visitor is not None:
+            return leaf_visitor(node)
+
+        visitor = self._visitors.get(node_type)
+        if visitor is None:
+            visitor = self._resolve_visitor(node_type)
+        return visitor(node)
+
+    def _visit_alias_expr(self, node: astx.AliasExpr) -> str:
         """Handle AliasExpr nodes."""
         if node.asname:
             return f"{node.name} as {node.asname}"
         return f"{node.name}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Argument) -> str:
-        """Handle UnaryOp nodes."""
+    def _visit_argument(self, node: astx.Argument) -> str:
+        """Handle Argument nodes."""
         type_ = self.visit(node.type_)
         return f"{node.name}: {type_}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Arguments) -> str:
-        """Handle UnaryOp nodes."""
+    def _visit_arguments(self, node: astx.Arguments) -> str:
+        """Handle Arguments nodes."""
         return ", ".join([self.visit(arg) for arg in node.nodes])
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.BinaryOp) -> str:
+    def _visit_binary_op(self, node: astx.BinaryOp) -> str:
         """Handle BinaryOp nodes."""
         lhs = self.visit(node.lhs)
         rhs = self.visit(node.rhs)
         return f"({lhs} {node.op_code} {rhs})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Block) -> str:
+    def _visit_block(self, node: astx.Block) -> str:
         """Handle Block nodes."""
         return self._generate_block(node)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ClassDefStmt) -> str:
+    def _visit_class_def_stmt(self, node: astx.ClassDefStmt) -> str:
         """Handle ClassDefStmt nodes."""
         class_type = "(ABC)" if node.is_abstract else ""
-        return f"class {node.name}{class_type}:" f"\n {self.visit(node.body)}"
+        body = self._generate_block(node.body)
+        return f"class {node.name}{class_type}:\n {body}"
+
+    def _visit_data_type(self, node: astx.DataType) -> str:
+        """Handle data types translated to a fixed Python type name."""
+        for base in type(node).__mro__:
+            type_str = self._TYPE_STRINGS.get(base)
+            if type_str is not None:
+                return type_str
+        raise Exception(f"Not implemented yet ({node}).")
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.EnumDeclStmt) -> str:
+    def _visit_enum_decl_stmt(self, node: astx.EnumDeclStmt) -> str:
         """Handle EnumDeclStmt nodes."""
         attr_str = "\n    ".join(self.visit(attr) for attr in node.attributes)
         return f"class {node.name}(Enum):\n    {attr_str}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ForRangeLoopExpr) -> str:
+    def _visit_for_range_loop_expr(self, node: astx.ForRangeLoopExpr) -> str:
         """Handle ForRangeLoopExpr nodes."""
         return (
-            f"result = [{self.visit(node.body)} for "
+            f"result = [{self._generate_block(node.body)} for "
             f" {node.variable.name} in range "
             f"({self.visit(node.start)},{self.visit(node.end)},"
             f"{self.visit(node.step)})]"
         )
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Function) -> str:
+    def _visit_function(self, node: astx.Function) -> str:
         """Handle Function nodes."""
-        args = self.visit(node.prototype.args)
-        returns = (
-            f" -> {self.visit(node.prototype.return_type)}"
-            if node.prototype.return_type
-            else ""
-        )
-        header = f"def {node.name}({args}){returns}:"
-        body = self.visit(node.body)
-        return f"{header}\n{body}"
+        return "\n".join(self._function_lines(node))
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.FunctionReturn) -> str:
+    def _visit_function_return(self, node: astx.FunctionReturn) -> str:
         """Handle FunctionReturn nodes."""
         value = self.visit(node.value) if node.value else ""
         return f"return {value}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.IfExpr) -> str:
+    def _visit_if_expr(self, node: astx.IfExpr) -> str:
         """Handle IfExpr nodes."""
         if node.else_:
             return (
-                f"{self.visit(node.then)} if "
+                f"{self._generate_block(node.then)} if "
                 f" {self.visit(node.condition)}"
-                f" else {self.visit(node.else_)}"
+                f" else {self._generate_block(node.else_)}"
             )
         return (
-            f"{self.visit(node.then)} if "
+            f"{self._generate_block(node.then)} if "
             f" {self.visit(node.condition)} else None"
         )
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.IfStmt) -> str:
+    def _visit_if_stmt(self, node: astx.IfStmt) -> str:
         """Handle IfStmt nodes."""
-        if node.else_:
-            return (
-                f"if {self.visit(node.condition)}:"
-                f"\n{self._generate_block(node.then)}"
-                f"\nelse:"
-                f"\n{self._generate_block(node.else_)}"
-            )
-        return (
-            f"if {self.visit(node.condition)}:"
-            f"\n{self._generate_block(node.then)}"
-        )
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromStmt) -> str:
-        """Handle ImportFromStmt nodes."""
-        names = [self.visit(name) for name in node.names]
-        level_dots = "." * node.level
-        module_str = (
-            f"{level_dots}{node.module}" if node.module else level_dots
-        )
-        names_str = ", ".join(str(name) for name in names)
-        return f"from {module_str} import {names_str}"
+        return "\n".join(self._if_stmt_lines(node))
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportExpr) -> str:
+    def _visit_import_expr(self, node: astx.ImportExpr) -> str:
         """Handle ImportExpr nodes."""
         names = [self.visit(name) for name in node.names]
-        names_list = []
-        for name in names:
-            str_ = f"__import__('{name}') "
-            names_list.append(str_)
-        names_str = ", ".join(x for x in names_list)
-
-        # name if one import or name1, name2, etc if multiple imports
-        num = [
-            "" if len(names) == 1 else str(n) for n in range(1, len(names) + 1)
-        ]
-        call = ["module" + str(n) for n in num]
-        call_str = ", ".join(x for x in call)
-
-        # assign tuple if multiple imports
-        names_str = (
-            names_str if len(names_list) == 1 else "(" + names_str + ")"
-        )
-
-        return f"{call_str} = {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromExpr) -> str:
+        if len(names) == 1:
+            return f"module = __import__('{names[0]}') "
+
+        # module1, module2, etc assigned from a tuple if multiple imports
+        calls = []
+        imports = []
+        for idx, name in enumerate(names, start=1):
+            calls.append(f"module{idx}")
+            imports.append(f"__import__('{name}') ")
+        return f"{', '.join(calls)} = ({', '.join(imports)})"
+
+    def _visit_import_from_expr(self, node: astx.ImportFromExpr) -> str:
         """Handle ImportFromExpr nodes."""
         names = [self.visit(name) for name in node.names]
         level_dots = "." * node.level
         module_str = (
             f"{level_dots}{node.module}" if node.module else level_dots
         )
-        names_list = []
-        for name in names:
-            str_ = (
+        if len(names) == 1:
+            return (
+                f"name = getattr(__import__('{module_str}', "
+                f"fromlist=['{names[0]}']), '{names[0]}')"
+            )
+
+        # name1, name2, etc assigned from a tuple if multiple imports
+        calls = []
+        imports = []
+        for idx, name in enumerate(names, start=1):
+            calls.append(f"name{idx}")
+            imports.append(
                 f"getattr(__import__('{module_str}', "
                 f"fromlist=['{name}']), '{name}')"
             )
-            names_list.append(str_)
-        names_str = ", ".join(x for x in names_list)
+        return f"{', '.join(calls)} = ({', '.join(imports)})"
 
-        # name if one import or name1, name2, etc if multiple imports
-        num = [
-            "" if len(names) == 1 else str(n) for n in range(1, len(names) + 1)
-        ]
-        call = ["name" + str(n) for n in num]
-        call_str = ", ".join(x for x in call)
-
-        # assign tuple if multiple imports
-        names_str = (
-            names_str if len(names_list) == 1 else "(" + names_str + ")"
-        )
-
-        return f"{call_str} = {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportStmt) -> str:
-        """Handle ImportStmt nodes."""
-        names = [self.visit(name) for name in node.names]
-        names_str = ", ".join(x for x in names)
-        return f"import {names_str}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.ImportFromStmt) -> str:
+    def _visit_import_from_stmt(self, node: astx.ImportFromStmt) -> str:
         """Handle ImportFromStmt nodes."""
         names = [self.visit(name) for name in node.names]
         level_dots = "." * node.level
@@ -226,215 +365,141 @@ class ASTxPythonTranspiler:
         names_str = ", ".join(str(name) for name in names)
         return f"from {module_str} import {names_str}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LambdaExpr) -> str:
+    def _visit_import_stmt(self, node: astx.ImportStmt) -> str:
+        """Handle ImportStmt nodes."""
+        names = [self.visit(name) for name in node.names]
+        names_str = ", ".join(x for x in names)
+        return f"import {names_str}"
+
+    def _visit_lambda_expr(self, node: astx.LambdaExpr) -> str:
         """Handle LambdaExpr nodes."""
         params_str = ", ".join(param.name for param in node.params)
         return f"lambda {params_str}: {self.visit(node.body)}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralBoolean) -> str:
+    def _visit_literal_boolean(self, node: astx.LiteralBoolean) -> str:
         """Handle LiteralBoolean nodes."""
         return "True" if node.value else "False"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex32) -> str:
-        """Handle LiteralComplex32 nodes."""
+    def _visit_literal_complex(self, node: astx.LiteralComplex) -> str:
+        """Handle LiteralComplex nodes."""
         real = node.value[0]
         imag = node.value[1]
         return f"complex({real}, {imag})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex) -> str:
-        """Handle LiteralComplex nodes."""
+    def _visit_literal_complex32(self, node: astx.LiteralComplex32) -> str:
+        """Handle LiteralComplex32 nodes."""
         real = node.value[0]
         imag = node.value[1]
         return f"complex({real}, {imag})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralComplex64) -> str:
+    def _visit_literal_complex64(self, node: astx.LiteralComplex64) -> str:
         """Handle LiteralComplex64 nodes."""
         real = node.value[0]
         imag = node.value[1]
         return f"complex({real}, {imag})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat16) -> str:
+    def _visit_literal_date(self, node: astx.LiteralDate) -> str:
+        """Handle LiteralDate nodes."""
+        return f"datetime.strptime({node.value!r}, '%Y-%m-%d').date()"
+
+    def _visit_literal_date_time(self, node: astx.LiteralDateTime) -> str:
+        """Handle LiteralDateTime nodes."""
+        return f"datetime.strptime({node.value!r}, '%Y-%m-%dT%H:%M:%S')"
+
+    def _visit_literal_float16(self, node: astx.LiteralFloat16) -> str:
         """Handle LiteralFloat nodes."""
         return str(node.value)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat32) -> str:
+    def _visit_literal_float32(self, node: astx.LiteralFloat32) -> str:
         """Handle LiteralFloat nodes."""
         return str(node.value)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralFloat64) -> str:
+    def _visit_literal_float64(self, node: astx.LiteralFloat64) -> str:
         """Handle LiteralFloat nodes."""
         return str(node.value)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralInt32) -> str:
+    def _visit_literal_int32(self, node: astx.LiteralInt32) -> str:
         """Handle LiteralInt32 nodes."""
         return str(node.value)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralUTF8String) -> str:
-        """Handle LiteralUTF8String nodes."""
-        return repr(node.value)
+    def _visit_literal_time(self, node: astx.LiteralTime) -> str:
+        """Handle LiteralTime nodes."""
+        return f"datetime.strptime({node.value!r}, '%H:%M:%S').time()"
+
+    def _visit_literal_timestamp(self, node: astx.LiteralTimestamp) -> str:
+        """Handle LiteralTimestamp nodes."""
+        return f"datetime.strptime({node.value!r}, '%Y-%m-%d %H:%M:%S')"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralUTF8Char) -> str:
+    def _visit_literal_utf8_char(self, node: astx.LiteralUTF8Char) -> str:
         """Handle LiteralUTF8Char nodes."""
         return repr(node.value)
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(
+    def _visit_literal_utf8_string(self, node: astx.LiteralUTF8String) -> str:
+        """Handle LiteralUTF8String nodes."""
+        return repr(node.value)
+
+    def _visit_struct_stmt(
         self, node: Union[astx.StructDeclStmt, astx.StructDefStmt]
     ) -> str:
         """Handle StructDeclStmt and StructDefStmt nodes."""
         attrs_str = "\n    ".join(self.visit(attr) for attr in node.attributes)
         return f"@dataclass \nclass {node.name}:\n    {attrs_str}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.SubscriptExpr) -> str:
+    def _visit_subscript_expr(self, node: astx.SubscriptExpr) -> str:
         """Handle SubscriptExpr nodes."""
+        # indexes and slice bounds are expected to be literals
         lower_str = (
-            str(node.lower.value)
+            str(cast(astx.Literal, node.lower).value)
             if not isinstance(node.lower, astx.LiteralNone)
-            else str(node.index.value)
+            else str(cast(astx.Literal, node.index).value)
         )
         upper_str = (
-            ":" + str(node.upper.value)
+            ":" + str(cast(astx.Literal, node.upper).value)
             if not isinstance(node.upper, astx.LiteralNone)
             else ""
         )
         step_str = (
-            ":" + str(node.step.value)
+            ":" + str(cast(astx.Literal, node.step).value)
             if not isinstance(node.step, astx.LiteralNone)
             else ""
         )
-        return f"{node.value.name}[{lower_str}{upper_str}{step_str}]"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Complex32) -> str:
-        """Handle Complex32 nodes."""
-        return "Complex"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Complex64) -> str:
-        """Handle Complex64 nodes."""
-        return "Complex"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float16) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float32) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Float64) -> str:
-        """Handle Float nodes."""
-        return "float"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Int32) -> str:
-        """Handle Int32 nodes."""
-        return "int"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.TypeCastExpr) -> str:
+        name = cast(astx.Variable, node.value).name
+        return f"{name}[{lower_str}{upper_str}{step_str}]"
+
+    def _visit_type_cast_expr(self, node: astx.TypeCastExpr) -> str:
         """Handle TypeCastExpr nodes."""
-        return f"cast({self.visit(node.target_type)}, {node.expr.name})"
+        target_type = self.visit(node.target_type)
+        return f"cast({target_type}, {cast(astx.Variable, node.expr).name})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UnaryOp) -> str:
+    def _visit_unary_op(self, node: astx.UnaryOp) -> str:
         """Handle UnaryOp nodes."""
         operand = self.visit(node.operand)
         return f"({node.op_code}{operand})"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UTF8Char) -> str:
-        """Handle UTF8Char nodes."""
-        return repr(node.value)
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.UTF8String) -> str:
-        """Handle UTF8String nodes."""
-        return repr(node.value)
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Variable) -> str:
+    def _visit_variable(self, node: astx.Variable) -> str:
         """Handle Variable nodes."""
         return node.name
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.VariableAssignment) -> str:
+    def _visit_variable_assignment(self, node: astx.VariableAssignment) -> str:
         """Handle VariableAssignment nodes."""
         target = node.name
         value = self.visit(node.value)
         return f"{target} = {value}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.VariableDeclaration) -> str:
+    def _visit_variable_declaration(
+        self, node: astx.VariableDeclaration
+    ) -> str:
         """Handle VariableDeclaration nodes."""
         value = self.visit(node.value)
-        return f"{node.name}: {node.value.type_.__class__.__name__} = {value}"
+        type_name = cast(astx.Literal, node.value).type_.__class__.__name__
+        return f"{node.name}: {type_name} = {value}"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.WhileExpr) -> str:
+    def _visit_while_expr(self, node: astx.WhileExpr) -> str:
         """Handle WhileExpr nodes."""
         condition = self.visit(node.condition)
-        body = self.visit(node.body)
+        body = self._generate_block(node.body)
         return f"[{body} for _ in iter(lambda: {condition}, False)]"
 
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.WhileStmt) -> str:
+    def _visit_while_stmt(self, node: astx.WhileStmt) -> str:
         """Handle WhileStmt nodes."""
-        condition = self.visit(node.condition)
-        body = self._generate_block(node.body)
-        return f"while {condition}:\n{body}"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Date) -> str:
-        """Handle Date nodes."""
-        return "date"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Time) -> str:
-        """Handle Time nodes."""
-        return "time"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.Timestamp) -> str:
-        """Handle Timestamp nodes."""
-        return "timestamp"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.DateTime) -> str:
-        """Handle DateTime nodes."""
-        return "datetime"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralDate) -> str:
-        """Handle LiteralDate nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%d').date()"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralTime) -> str:
-        """Handle LiteralTime nodes."""
-        return f"datetime.strptime({node.value!r}, '%H:%M:%S').time()"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralTimestamp) -> str:
-        """Handle LiteralTimestamp nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%d %H:%M:%S')"
-
-    @dispatch  # type: ignore[no-redef]
-    def visit(self, node: astx.LiteralDateTime) -> str:
-        """Handle LiteralDateTime nodes."""
-        return f"datetime.strptime({node.value!r}, '%Y-%m-%dT%H:%M:%S')"
+        return "\n".join(self._while_stmt_lines(node))
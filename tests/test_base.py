@@ -61,6 +61,11 @@ def test_ast_nodes() -> None:
 
     assert count == 1
 
+    # nested iterations over the same block are independent
+    astx.VariableDeclaration("b", type_=astx.Int32(), parent=block)
+    pairs = [(outer, inner) for outer in block for inner in block]
+    assert len(pairs) == len(block) ** 2
+
 
 def test_data_type() -> None:
     """Test DataType class."""
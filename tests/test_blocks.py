@@ -22,3 +22,18 @@ def test_block() -> None:
     block.append(decl_b)
 
     block.append(sum_op)
+
+
+def test_block_nodes() -> None:
+    """Test ASTx block created from a list of nodes."""
+    decl_a = VariableDeclaration("a", type_=Int32(), value=LiteralInt32(1))
+    sum_op = BinaryOp(op_code="+", lhs=Variable("a"), rhs=Variable("a"))
+
+    block = Block(nodes=[decl_a, sum_op])
+
+    appended_block = Block()
+    appended_block.append(decl_a)
+    appended_block.append(sum_op)
+
+    assert block.nodes == [decl_a, sum_op]
+    assert block.get_struct() == appended_block.get_struct()
@@ -1,162 +1,137 @@
 """Test Python Transpiler."""
 
 import astx
+import pytest
 
 from astx.tools.transpilers import python as astx2py
 
 transpiler = astx2py.ASTxPythonTranspiler()
 
-
-def test_transpiler_multiple_imports_stmt() -> None:
-    """Test astx.ImportStmt multiple imports."""
-    alias1 = astx.AliasExpr(name="math")
-    alias2 = astx.AliasExpr(name="matplotlib", asname="mtlb")
-
-    # Create an import statement
-    import_stmt = astx.ImportStmt(names=[alias1, alias2])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_stmt)
-
-    expected_code = "import math, matplotlib as mtlb"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_import_from_stmt() -> None:
-    """Test astx.ImportFromStmt importing from module."""
-    alias = astx.AliasExpr(name="pyplot", asname="plt")
-
-    import_from_stmt = astx.ImportFromStmt(
-        module="matplotlib", names=[alias], level=0
-    )
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_stmt)
-
-    expected_code = "from matplotlib import pyplot as plt"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_wildcard_import_from_stmt() -> None:
-    """Test astx.ImportFromStmt wildcard import from module."""
-    alias = astx.AliasExpr(name="*")
-
-    import_from_stmt = astx.ImportFromStmt(module="matplotlib", names=[alias])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_stmt)
-
-    expected_code = "from matplotlib import *"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_future_import_from_stmt() -> None:
-    """Test astx.ImportFromStmt from future import."""
-    alias = astx.AliasExpr(name="division")
-
-    import_from_stmt = astx.ImportFromStmt(module="__future__", names=[alias])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_stmt)
-
-    expected_code = "from __future__ import division"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_multiple_imports_expr() -> None:
-    """Test astx.ImportExpr multiple imports."""
-    alias1 = astx.AliasExpr(name="sqrt", asname="square_root")
-    alias2 = astx.AliasExpr(name="pi")
-
-    import_expr = astx.ImportExpr([alias1, alias2])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_expr)
-
-    expected_code = (
-        "module1, module2 = "
-        "(__import__('sqrt as square_root') , "
-        "__import__('pi') )"
-    )
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_import_from_expr() -> None:
-    """Test astx.ImportFromExpr importing from module."""
-    alias1 = astx.AliasExpr(name="sqrt", asname="square_root")
-
-    import_from_expr = astx.ImportFromExpr(module="math", names=[alias1])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_expr)
-
-    expected_code = (
-        "name = "
-        "getattr(__import__('math', "
-        "fromlist=['sqrt as square_root']), "
-        "'sqrt as square_root')"
-    )
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_wildcard_import_from_expr() -> None:
-    """Test astx.ImportFromExpr wildcard import from module."""
-    alias1 = astx.AliasExpr(name="*")
-
-    import_from_expr = astx.ImportFromExpr(module="math", names=[alias1])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_expr)
-
-    expected_code = "name = getattr(__import__('math', fromlist=['*']), '*')"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_transpiler_future_import_from_expr() -> None:
-    """Test astx.ImportFromExpr from future import."""
-    alias1 = astx.AliasExpr(name="division")
-
-    import_from_expr = astx.ImportFromExpr(module="__future__", names=[alias1])
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_expr)
-
-    expected_code = (
-        "name = "
-        "getattr(__import__('__future__', "
-        "fromlist=['division']), "
-        "'division')"
-    )
+IMPORT_FROM_EXPR_TEMPLATE = (
+    "getattr(__import__({mod!r}, fromlist=[{name!r}]), {name!r})"
+)
+
+EXPECTED_FUNCTION_CODE = "\n".join(
+    [
+        "def add(x: int, y: int) -> int:",
+        "    result = (x + y)",
+        "    return result",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "node,expected_code",
+    [
+        # multiple imports
+        (
+            astx.ImportStmt(
+                names=[
+                    astx.AliasExpr(name="math"),
+                    astx.AliasExpr(name="matplotlib", asname="mtlb"),
+                ]
+            ),
+            "import math, matplotlib as mtlb",
+        ),
+        # importing from module
+        (
+            astx.ImportFromStmt(
+                module="matplotlib",
+                names=[astx.AliasExpr(name="pyplot", asname="plt")],
+                level=0,
+            ),
+            "from matplotlib import pyplot as plt",
+        ),
+        # wildcard import from module
+        (
+            astx.ImportFromStmt(
+                module="matplotlib", names=[astx.AliasExpr(name="*")]
+            ),
+            "from matplotlib import *",
+        ),
+        # from future import
+        (
+            astx.ImportFromStmt(
+                module="__future__", names=[astx.AliasExpr(name="division")]
+            ),
+            "from __future__ import division",
+        ),
+    ],
+)
+def test_transpiler_import_stmt(node: astx.AST, expected_code: str) -> None:
+    """Test astx.ImportStmt and astx.ImportFromStmt."""
+    generated_code = transpiler.visit(node)
 
     assert generated_code == expected_code, "generated_code != expected_code"
 
 
-def test_transpiler_relative_import_from_expr() -> None:
-    """Test astx.ImportFromExpr relative imports."""
-    alias1 = astx.AliasExpr(name="division")
-    alias2 = astx.AliasExpr(name="matplotlib", asname="mtlb")
-
-    import_from_expr = astx.ImportFromExpr(names=[alias1, alias2], level=1)
-
-    # Generate Python code
-    generated_code = transpiler.visit(import_from_expr)
-
-    expected_code = (
-        "name1, name2 = "
-        "(getattr("
-        "__import__('.', fromlist=['division']), "
-        "'division'), "
-        "getattr("
-        "__import__('.', fromlist=['matplotlib as mtlb']), "
-        "'matplotlib as mtlb'))"
-    )
+@pytest.mark.parametrize(
+    "node,expected_code",
+    [
+        # multiple imports
+        (
+            astx.ImportExpr(
+                [
+                    astx.AliasExpr(name="sqrt", asname="square_root"),
+                    astx.AliasExpr(name="pi"),
+                ]
+            ),
+            (
+                "module1, module2 = "
+                "(__import__('sqrt as square_root') , "
+                "__import__('pi') )"
+            ),
+        ),
+        # importing from module
+        (
+            astx.ImportFromExpr(
+                module="math",
+                names=[astx.AliasExpr(name="sqrt", asname="square_root")],
+            ),
+            "name = "
+            + IMPORT_FROM_EXPR_TEMPLATE.format(
+                mod="math", name="sqrt as square_root"
+            ),
+        ),
+        # wildcard import from module
+        (
+            astx.ImportFromExpr(
+                module="math", names=[astx.AliasExpr(name="*")]
+            ),
+            "name = " + IMPORT_FROM_EXPR_TEMPLATE.format(mod="math", name="*"),
+        ),
+        # from future import
+        (
+            astx.ImportFromExpr(
+                module="__future__", names=[astx.AliasExpr(name="division")]
+            ),
+            "name = "
+            + IMPORT_FROM_EXPR_TEMPLATE.format(
+                mod="__future__", name="division"
+            ),
+        ),
+        # relative imports
+        (
+            astx.ImportFromExpr(
+                names=[
+                    astx.AliasExpr(name="division"),
+                    astx.AliasExpr(name="matplotlib", asname="mtlb"),
+                ],
+                level=1,
+            ),
+            "name1, name2 = ("
+            + IMPORT_FROM_EXPR_TEMPLATE.format(mod=".", name="division")
+            + ", "
+            + IMPORT_FROM_EXPR_TEMPLATE.format(
+                mod=".", name="matplotlib as mtlb"
+            )
+            + ")",
+        ),
+    ],
+)
+def test_transpiler_import_expr(node: astx.AST, expected_code: str) -> None:
+    """Test astx.ImportExpr and astx.ImportFromExpr."""
+    generated_code = transpiler.visit(node)
 
     assert generated_code == expected_code, "generated_code != expected_code"
 
@@ -201,24 +176,23 @@ def test_transpiler_function() -> None:
     )
 
     # Function body
-    body = astx.Block()
-    body.append(
-        astx.VariableAssignment(
-            name="result",
-            value=astx.BinaryOp(
-                op_code="+",
-                lhs=astx.Variable(name="x"),
-                rhs=astx.Variable(name="y"),
-                loc=astx.SourceLocation(line=2, col=8),
+    body: astx.Block[astx.AST] = astx.Block(
+        nodes=[
+            astx.VariableAssignment(
+                name="result",
+                value=astx.BinaryOp(
+                    op_code="+",
+                    lhs=astx.Variable(name="x"),
+                    rhs=astx.Variable(name="y"),
+                    loc=astx.SourceLocation(line=2, col=8),
+                ),
+                loc=astx.SourceLocation(line=2, col=4),
             ),
-            loc=astx.SourceLocation(line=2, col=4),
-        )
-    )
-    body.append(
-        astx.FunctionReturn(
-            value=astx.Variable(name="result"),
-            loc=astx.SourceLocation(line=3, col=4),
-        )
+            astx.FunctionReturn(
+                value=astx.Variable(name="result"),
+                loc=astx.SourceLocation(line=3, col=4),
+            ),
+        ]
     )
 
     # Function definition
@@ -234,93 +208,29 @@ def test_transpiler_function() -> None:
 
     # Generate Python code
     generated_code = transpiler.visit(add_function)
-    expected_code = "\n".join(
-        [
-            "def add(x: int, y: int) -> int:",
-            "    result = (x + y)",
-            "    return result",
-        ]
-    )
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_literal_int32() -> None:
-    """Test astx.LiteralInt32."""
-    # Create a LiteralInt32 node
-    literal_int32_node = astx.LiteralInt32(value=42)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_int32_node)
-    expected_code = "42"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_literal_float16() -> None:
-    """Test astx.LiteralFloat16."""
-    # Create a LiteralFloat16 node
-    literal_float16_node = astx.LiteralFloat16(value=3.14)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_float16_node)
-    expected_code = "3.14"
+    expected_code = EXPECTED_FUNCTION_CODE
 
     assert generated_code == expected_code, "generated_code != expected_code"
 
 
-def test_literal_float32() -> None:
-    """Test astx.LiteralFloat32."""
-    # Create a LiteralFloat32 node
-    literal_float32_node = astx.LiteralFloat32(value=2.718)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_float32_node)
-    expected_code = "2.718"
-
-    assert generated_code == expected_code, "generated_code != expected_code"
-
-
-def test_literal_float64() -> None:
-    """Test astx.LiteralFloat64."""
-    # Create a LiteralFloat64 node
-    literal_float64_node = astx.LiteralFloat64(value=1.414)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_float64_node)
-    expected_code = "1.414"
+@pytest.mark.parametrize(
+    "node,expected_code",
+    [
+        (astx.LiteralInt32(value=42), "42"),
+        (astx.LiteralFloat16(value=3.14), "3.14"),
+        (astx.LiteralFloat32(value=2.718), "2.718"),
+        (astx.LiteralFloat64(value=1.414), "1.414"),
+        (astx.LiteralComplex32(real=1, imag=2.8), "complex(1, 2.8)"),
+        (astx.LiteralComplex64(real=3.5, imag=4), "complex(3.5, 4)"),
+    ],
+)
+def test_literal(node: astx.Literal, expected_code: str) -> None:
+    """Test numeric literals."""
+    generated_code = transpiler.visit(node)
 
     assert generated_code == expected_code, "generated_code != expected_code"
 
 
-def test_literal_complex32() -> None:
-    """Test astx.LiteralComplex32."""
-    # Create a LiteralComplex32 node
-    literal_complex32_node = astx.LiteralComplex32(real=1, imag=2.8)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_complex32_node)
-    expected_code = "complex(1, 2.8)"
-
-    assert (
-        generated_code == expected_code
-    ), f"Expected '{expected_code}', but got '{generated_code}'"
-
-
-def test_literal_complex64() -> None:
-    """Test astx.LiteralComplex64."""
-    # Create a LiteralComplex64 node
-    literal_complex64_node = astx.LiteralComplex64(real=3.5, imag=4)
-
-    # Generate Python code
-    generated_code = transpiler.visit(literal_complex64_node)
-    expected_code = "complex(3.5, 4)"
-
-    assert (
-        generated_code == expected_code
-    ), f"Expected '{expected_code}', but got '{generated_code}'"
-
-
 def test_transpiler_typecastexpr() -> None:
     """Test astx.TypeCastExpr."""
     # Expression to cast
@@ -950,3 +860,80 @@ def test_transpiler_subscriptexpr_index() -> None:
     assert (
         generated_code == expected_code
     ), f"Expected '{expected_code}', but got '{generated_code}'"
+
+
+def test_transpiler_shared_subtree() -> None:
+    """Test shared subtrees and re-visiting a mutated block."""
+    x_var = astx.Variable(name="x")
+    shared = astx.BinaryOp(op_code="+", lhs=x_var, rhs=x_var)
+
+    body = astx.Block()
+    body.append(astx.VariableAssignment(name="y", value=shared))
+
+    while_stmt = astx.WhileStmt(condition=shared, body=body)
+
+    generated_code = transpiler.visit(while_stmt)
+    expected_code = "while (x + x):\n    y = (x + x)"
+
+    assert generated_code == expected_code, "generated_code != expected_code"
+
+    body.append(astx.VariableAssignment(name="z", value=shared))
+
+    generated_code = transpiler.visit(while_stmt)
+    expected_code = "while (x + x):\n    y = (x + x)\n    z = (x + x)"
+
+    assert generated_code == expected_code, "generated_code != expected_code"
+
+    inner = astx.Block(name="inner")
+    inner.append(astx.VariableAssignment(name="y", value=shared))
+    outer = astx.Block(name="outer")
+    outer.append(inner)
+
+    generated_code = transpiler.visit(outer)
+    expected_code = "            y = (x + x)"
+
+    assert generated_code == expected_code, "generated_code != expected_code"
+
+    inner.append(astx.VariableAssignment(name="z", value=shared))
+
+    generated_code = transpiler.visit(outer)
+    expected_code = "            y = (x + x)\n        z = (x + x)"
+
+    assert generated_code == expected_code, "generated_code != expected_code"
+
+
+def test_transpiler_not_implemented() -> None:
+    """Test that nodes without a handler raise instead of falling through."""
+    with pytest.raises(Exception, match="Not implemented yet"):
+        transpiler.visit(astx.LiteralInt8(1))
+
+
+def test_transpiler_utf8_string_type() -> None:
+    """Test Type[astx.UTF8String] and Type[astx.UTF8Char]."""
+    arg = astx.Argument(name="s", type_=astx.UTF8String())
+
+    assert transpiler.visit(arg) == "s: str", "generated_code != expected_code"
+    assert (
+        transpiler.visit(astx.UTF8Char()) == "str"
+    ), "generated_code != expected_code"
+
+
+def test_transpiler_indent_str() -> None:
+    """Test that a custom indent_str is honored after previous visits."""
+    local_transpiler = astx2py.ASTxPythonTranspiler()
+
+    body = astx.Block()
+    body.append(astx.VariableAssignment(name="x", value=astx.LiteralInt32(1)))
+    while_stmt = astx.WhileStmt(condition=astx.Variable(name="x"), body=body)
+
+    generated_code = local_transpiler.visit(while_stmt)
+    assert (
+        generated_code == "while x:\n    x = 1"
+    ), "generated_code != expected_code"
+
+    local_transpiler.indent_str = "\t"
+
+    generated_code = local_transpiler.visit(while_stmt)
+    assert (
+        generated_code == "while x:\n\tx = 1"
+    ), "generated_code != expected_code"